@@ -1,6 +1,7 @@
 import curses
 import sys
 import argparse
+import unicodedata
 
 def right(window, buffer, cursor):
     cursor.right(buffer)
@@ -14,72 +15,169 @@ def left(window, buffer, cursor):
     window.horizontal_scroll(cursor)
 
 
+def up(window, buffer, cursor):
+    cursor.up(buffer)
+    window.up(cursor)
+    window.horizontal_scroll(cursor)
+
+
+def down(window, buffer, cursor):
+    cursor.down(buffer)
+    window.down(buffer, cursor)
+    window.horizontal_scroll(cursor)
+
+
+def beginning_of_line(window, buffer, cursor):
+    cursor.beginning_of_line()
+    window.horizontal_scroll(cursor)
+
+
+def end_of_line(window, buffer, cursor):
+    cursor.end_of_line(buffer)
+    window.horizontal_scroll(cursor)
+
+
+def page_up(window, buffer, cursor):
+    window.page_up(buffer, cursor)
+    window.horizontal_scroll(cursor)
+
+
+def page_down(window, buffer, cursor):
+    window.page_down(buffer, cursor)
+    window.horizontal_scroll(cursor)
+
+
+def newline(window, buffer, cursor):
+    buffer.split(cursor)
+    right(window, buffer, cursor)
+
+
+def delete(window, buffer, cursor):
+    buffer.delete(cursor)
+
+
+def backspace(window, buffer, cursor):
+    if (cursor.row, cursor.col) > (0, 0):
+        left(window, buffer, cursor)
+        buffer.delete(cursor)
+
+
+def save(window, buffer, cursor):
+    buffer.save()
+
+
+def quit_editor(window, buffer, cursor):
+    sys.exit(0)
+
+
+def insert(window, buffer, cursor, string):
+    buffer.insert(cursor, string)
+    # The inserted text stays on the cursor's line, so step over it at once
+    cursor.col += len(string)
+    window.horizontal_scroll(cursor)
+
+
+KEYS = {
+    "\x11": quit_editor,  # Ctrl-q
+    "KEY_UP": up,
+    "\x10": up,  # Ctrl-p
+    "KEY_DOWN": down,
+    "\x0e": down,  # Ctrl-n
+    "KEY_LEFT": left,
+    "\x02": left,  # Ctrl-b
+    "KEY_RIGHT": right,
+    "\x06": right,  # Ctrl-f
+    "\x01": beginning_of_line,  # Ctrl-a
+    "\x05": end_of_line,  # Ctrl-e
+    "\x13": save,  # Ctrl-s
+    "KEY_PPAGE": page_up,  # Page Up
+    "KEY_NPAGE": page_down,  # Page Down
+    "\n": newline,
+    "KEY_DELETE": delete,
+    "\x04": delete,  # Ctrl-d
+    "KEY_BACKSPACE": backspace,
+    "\x7f": backspace,
+}
+
+
+def keys(stdscr):
+    # Wait for one key, then also take any keys already queued (e.g. a
+    # paste) so a burst of input is applied before the next render
+    yield stdscr.getkey()
+    stdscr.nodelay(True)
+    try:
+        while True:
+            yield stdscr.getkey()
+    except curses.error:
+        pass
+    finally:
+        stdscr.nodelay(False)
+
+
+def display_line(line, col, ncols):
+    if col > 0:
+        line = "«" + line[col + 1 :]
+    if len(line) > ncols:
+        line = line[: ncols - 1] + "»"
+    return line
+
+
+def may_wrap(line):
+    # curses expands tabs and wide characters as it writes, so such a line
+    # can take more columns than len() counts and spill onto the next row
+    if "\t" in line:
+        return True
+    if line.isascii():
+        return False
+    return any(unicodedata.east_asian_width(c) in "WF" for c in line)
+
+
+def render(stdscr, buffer, window, cursor, drawn):
+    # Only rewrite screen rows whose text differs from the last frame
+    nrows, ncols, col = window.nrows, window.ncols, window.col
+    cursor_row = cursor.row - window.row
+    addstr, clrtoeol = stdscr.addstr, stdscr.clrtoeol
+    lines = buffer[window.row : window.row + nrows]
+    nlines = len(lines)
+    for row in range(nrows):
+        line = lines[row] if row < nlines else ""
+        line = display_line(line, col if row == cursor_row else 0, ncols)
+        if line != drawn[row]:
+            addstr(row, 0, line)
+            clrtoeol()
+            drawn[row] = line
+            if may_wrap(line):
+                # Repaint the rows below in case this one spilled onto them
+                drawn[row + 1 :] = [None] * (nrows - row - 1)
+    stdscr.move(*window.translate(cursor))
+
+
 def main(stdscr):
     parser = argparse.ArgumentParser()
     parser.add_argument("filename")
     args = parser.parse_args()
 
     with open(args.filename) as f:
-        buffer = Buffer(f.read().splitlines(), args.filename)
+        buffer = Buffer([line.rstrip("\n") for line in f], args.filename)
 
     window = Window(curses.LINES - 1, curses.COLS - 1)
     cursor = Cursor()
+    drawn = [None] * window.nrows
 
     while True:
-        stdscr.erase()
-        for row, line in enumerate(buffer[window.row : window.row + window.nrows]):
-            if row == cursor.row - window.row and window.col > 0:
-                line = "«" + line[window.col + 1 :]
-            if len(line) > window.ncols:
-                line = line[: window.ncols - 1] + "»"
-            stdscr.addstr(row, 0, line[: window.ncols])
-        stdscr.move(*window.translate(cursor))
-
-        k = stdscr.getkey()
-        if k == "\x11":  # Ctrl-q
-            sys.exit(0)
-        elif k in ("KEY_UP", "\x10"):  # Arrow up or Ctrl-p
-            cursor.up(buffer)
-            window.up(cursor)
-            window.horizontal_scroll(cursor)
-        elif k in ("KEY_DOWN", "\x0e"):  # Arrow down or Ctrl-n
-            cursor.down(buffer)
-            window.down(buffer, cursor)
-            window.horizontal_scroll(cursor)
-        elif k in ("KEY_LEFT", "\x02"):  # Arrow left or Ctrl-b
-            left(window, buffer, cursor)
-        elif k in ("KEY_RIGHT", "\x06"):  # Arrow right or Ctrl-f
-            right(window, buffer, cursor)
-        elif k == "\x01":  # Ctrl-a (beginning of line)
-            cursor.beginning_of_line()
-            window.horizontal_scroll(cursor)
-        elif k == "\x05":  # Ctrl-e (end of line)
-            cursor.end_of_line(buffer)
-            window.horizontal_scroll(cursor)
-        elif k == "\x13":  # Ctrl-s (save)
-            buffer.save()
-        elif k == "KEY_PPAGE":  # Page Up
-            window.page_up(buffer, cursor)
-            window.horizontal_scroll(cursor)
-        elif k == "KEY_NPAGE":  # Page Down
-            window.page_down(buffer, cursor)
-            window.horizontal_scroll(cursor)
-        elif k == "\n":
-            buffer.split(cursor)
-            right(window, buffer, cursor)
-        elif k in ("KEY_DELETE", "\x04"):  # Delete or Ctrl-d
-            buffer.delete(cursor)
-        elif k in ("KEY_BACKSPACE", "\x7f"):
-            if (cursor.row, cursor.col) > (0, 0):
-                left(window, buffer, cursor)
-                buffer.delete(cursor)
-        else:
-            buffer.insert(cursor, k)
-            for _ in k:
-                right(window, buffer, cursor)
+        render(stdscr, buffer, window, cursor, drawn)
+
+        for k in keys(stdscr):
+            handler = KEYS.get(k)
+            if handler:
+                handler(window, buffer, cursor)
+            else:
+                insert(window, buffer, cursor, k)
 
 
 class Buffer:
+    __slots__ = ("lines", "filename")
+
     def __init__(self, lines, filename=None):
         self.lines = lines
         self.filename = filename
@@ -96,37 +194,34 @@ class Buffer:
 
     def insert(self, cursor, string):
         row, col = cursor.row, cursor.col
-        current = self.lines.pop(row)
-        new = current[:col] + string + current[col:]
-        self.lines.insert(row, new)
+        current = self.lines[row]
+        self.lines[row] = current[:col] + string + current[col:]
 
     def split(self, cursor):
         row, col = cursor.row, cursor.col
-        current = self.lines.pop(row)
-        self.lines.insert(row, current[:col])
-        self.lines.insert(row + 1, current[col:])
+        current = self.lines[row]
+        self.lines[row : row + 1] = [current[:col], current[col:]]
 
     def delete(self, cursor):
         row, col = cursor.row, cursor.col
         if (row, col) < (self.bottom, len(self[row])):
-            current = self.lines.pop(row)
-            if col < len(self[row]):
-                new = current[:col] + current[col + 1 :]
-                self.lines.insert(row, new)
+            current = self.lines[row]
+            if col < len(current):
+                self.lines[row] = current[:col] + current[col + 1 :]
             else:
-                next = self.lines.pop(row)
-                new = current + next
-                self.lines.insert(row, new)
+                next = self.lines[row + 1]
+                self.lines[row : row + 2] = [current + next]
 
     def save(self):
         if self.filename:
+            # Write line by line rather than joining a copy of the whole file
             with open(self.filename, 'w') as f:
-                f.write('\n'.join(self.lines))
-                if self.lines:
-                    f.write('\n')
+                f.writelines(line + '\n' for line in self.lines)
 
 
 class Window:
+    __slots__ = ("nrows", "ncols", "row", "col")
+
     def __init__(self, nrows, ncols, row=0, col=0):
         self.nrows = nrows
         self.ncols = ncols
@@ -150,6 +245,9 @@ class Window:
         return cursor.row - self.row, cursor.col - self.col
 
     def horizontal_scroll(self, cursor, left_margin=5, right_margin=2):
+        # Common case: unscrolled window and cursor still on the first page
+        if self.col == 0 and cursor.col < self.ncols - right_margin:
+            return
         n_pages = cursor.col // (self.ncols - right_margin)
         self.col = max(n_pages * self.ncols - right_margin - left_margin, 0)
 
@@ -171,6 +269,8 @@ class Window:
 
 
 class Cursor:
+    __slots__ = ("row", "_col", "_col_hint")
+
     def __init__(self, row=0, col=0, col_hint=None):
         self.row = row
         self._col = col
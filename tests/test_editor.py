@@ -0,0 +1,59 @@
+import unittest
+
+from editor import Buffer, Cursor, Window, insert, render
+
+
+class TestBufferDelete(unittest.TestCase):
+    def test_delete_before_empty_last_line(self):
+        # Used to join the lines because the next line's length was checked
+        buffer = Buffer(["hello", ""])
+        buffer.delete(Cursor(0, 0))
+        self.assertEqual(buffer.lines, ["ello", ""])
+
+    def test_delete_inside_last_line(self):
+        # Used to raise IndexError
+        buffer = Buffer(["abc"])
+        buffer.delete(Cursor(0, 1))
+        self.assertEqual(buffer.lines, ["ac"])
+
+
+class FakeScreen:
+    def __init__(self):
+        self.rows = []
+
+    def addstr(self, row, col, string):
+        self.rows.append(row)
+
+    def clrtoeol(self):
+        pass
+
+    def move(self, row, col):
+        pass
+
+
+class TestRender(unittest.TestCase):
+    def test_unchanged_rows_are_skipped(self):
+        buffer = Buffer(["first", "second line", "third"])
+        window, cursor = Window(3, 40), Cursor()
+        screen, drawn = FakeScreen(), [None] * window.nrows
+        render(screen, buffer, window, cursor, drawn)
+        screen.rows = []
+        insert(window, buffer, cursor, "X")
+        render(screen, buffer, window, cursor, drawn)
+        self.assertEqual(screen.rows, [0])
+
+    def test_rows_below_a_tab_line_are_repainted(self):
+        # Tabs expand as curses writes them, so the edited row can spill
+        # onto the rows below; those must be redrawn even if unchanged
+        buffer = Buffer(["\t" * 11 + "abc", "second line", "third"])
+        window, cursor = Window(3, 40), Cursor()
+        screen, drawn = FakeScreen(), [None] * window.nrows
+        render(screen, buffer, window, cursor, drawn)
+        screen.rows = []
+        insert(window, buffer, cursor, "X")
+        render(screen, buffer, window, cursor, drawn)
+        self.assertEqual(screen.rows, [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()